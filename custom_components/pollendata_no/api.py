@@ -1,9 +1,13 @@
-"""API client for Pollen Data service."""
+"""API client for Pollen Data service.
+
+This module does not depend on Home Assistant and can be used on its own.
+"""
 import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+from aiohttp import hdrs
 import async_timeout
 
 from .const import (
@@ -12,7 +16,11 @@ from .const import (
     API_FORECAST,
     API_COMBINED,
     DEFAULT_TIMEOUT,
+    PRIORITY_BACKGROUND,
 )
+from .limiter import HostLimiter, get_host_limiter
+from .profiler import StageTimer
+from .transfer import ACCEPT_ENCODING, HostTransfer, get_host_transfer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,31 +37,128 @@ class PollenDataAPITimeoutError(PollenDataAPIError):
     """Exception to indicate a timeout error."""
 
 
+class PollenDataAPIStatusError(PollenDataAPIError):
+    """Exception to indicate an unsuccessful HTTP status."""
+
+    def __init__(self, status: int) -> None:
+        """Initialize the error."""
+        super().__init__(f"API request failed with status {status}")
+        self.status = status
+
+
+def normalize_pollen(data: Any) -> Dict[str, int]:
+    """Return active pollen levels (level > 0) from a raw pollen mapping."""
+    if not isinstance(data, dict):
+        return {}
+
+    active_pollen = {}
+    for pollen_type, level in data.items():
+        if isinstance(level, (int, float)) and level > 0:
+            active_pollen[pollen_type] = int(level)
+        elif isinstance(level, dict) and level.get("level", 0) > 0:
+            active_pollen[pollen_type] = int(level["level"])
+
+    return active_pollen
+
+
+def normalize_combined(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return normalized pollen data and forecast from a combined response."""
+    return {
+        "pollen": normalize_pollen(data.get("pollen", {})),
+        "forecast": data.get("forecast", ""),
+        "last_updated": data.get("last_updated", ""),
+    }
+
+
 class PollenDataAPI:
-    """API client for Pollen Data service."""
+    """API client for Pollen Data service.
+
+    When no session is given, the client creates its own and closes it in
+    ``close()`` or when used as an async context manager.
+    """
 
     def __init__(
         self,
         hostname: str,
-        session: aiohttp.ClientSession,
+        session: Optional[aiohttp.ClientSession] = None,
         timeout: int = DEFAULT_TIMEOUT,
+        limiter: Optional[HostLimiter] = None,
     ) -> None:
         """Initialize the API client."""
         self.hostname = hostname.rstrip("/")
         self.session = session
         self.timeout = timeout
         self.base_url = f"http://{self.hostname}"
+        self.limiter = limiter or get_host_limiter(self.hostname)
+        self.transfer: HostTransfer = get_host_transfer(self.hostname)
+        self.stage_timer = StageTimer()
+        self._close_session = False
+
+    async def __aenter__(self) -> "PollenDataAPI":
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the async context and close an owned session."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session if it was created by this client."""
+        if self.session is not None and self._close_session:
+            await self.session.close()
+            self.session = None
+            self._close_session = False
 
-    async def _request(self, endpoint: str) -> Dict[str, Any]:
-        """Make a request to the API."""
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating one if none was given."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._close_session = True
+        return self.session
+
+    async def _request(
+        self,
+        endpoint: str,
+        priority: int = PRIORITY_BACKGROUND,
+        params: Optional[Dict[str, str]] = None,
+        detect: bool = False,
+    ) -> Dict[str, Any]:
+        """Make a request to the API.
+
+        Responses requested with ``detect`` decide whether the host compresses.
+        """
         url = f"{self.base_url}{endpoint}"
-        _LOGGER.debug("Making request to %s", url)
 
+        with self.stage_timer.stage("queue"):
+            async with self.limiter.acquire(priority):
+                _LOGGER.debug("Making request to %s with params %s", url, params)
+                with self.stage_timer.stage("fetch"):
+                    return await self._fetch(url, params, detect)
+
+    async def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        detect: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch and decode a single URL."""
         try:
             async with async_timeout.timeout(self.timeout):
-                async with self.session.get(url) as response:
+                async with self._get_session().get(
+                    url,
+                    params=params,
+                    headers={hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING},
+                ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        body = await response.read()
+                        self.transfer.record_response(
+                            response.headers.get(hdrs.CONTENT_ENCODING),
+                            response.content_length,
+                            len(body),
+                            detect,
+                        )
+                        with self.stage_timer.stage("decode"):
+                            data = await response.json()
                         _LOGGER.debug("Response data: %s", data)
                         return data
                     else:
@@ -62,9 +167,7 @@ class PollenDataAPI:
                             response.status,
                             await response.text(),
                         )
-                        raise PollenDataAPIError(
-                            f"API request failed with status {response.status}"
-                        )
+                        raise PollenDataAPIStatusError(response.status)
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout error for %s: %s", url, err)
             raise PollenDataAPITimeoutError(f"Timeout error for {url}") from err
@@ -72,10 +175,10 @@ class PollenDataAPI:
             _LOGGER.error("Connection error for %s: %s", url, err)
             raise PollenDataAPIConnectionError(f"Connection error for {url}") from err
 
-    async def get_regions(self) -> List[str]:
+    async def get_regions(self, priority: int = PRIORITY_BACKGROUND) -> List[str]:
         """Get available regions."""
         try:
-            data = await self._request(API_REGIONS)
+            data = await self._request(API_REGIONS, priority)
             if isinstance(data, list):
                 return data
             elif isinstance(data, dict) and "regions" in data:
@@ -87,11 +190,13 @@ class PollenDataAPI:
             _LOGGER.error("Error getting regions: %s", err)
             raise
 
-    async def get_pollen_data(self, region: str) -> Dict[str, Any]:
+    async def get_pollen_data(
+        self, region: str, priority: int = PRIORITY_BACKGROUND
+    ) -> Dict[str, Any]:
         """Get pollen data for a region."""
         try:
             endpoint = API_POLLEN.format(region=region)
-            data = await self._request(endpoint)
+            data = await self._request(endpoint, priority)
             
             # Ensure we have a consistent data structure
             if not isinstance(data, dict):
@@ -99,23 +204,18 @@ class PollenDataAPI:
                 return {}
             
             # Filter out inactive pollen types (level 0)
-            active_pollen = {}
-            for pollen_type, level in data.items():
-                if isinstance(level, (int, float)) and level > 0:
-                    active_pollen[pollen_type] = int(level)
-                elif isinstance(level, dict) and level.get("level", 0) > 0:
-                    active_pollen[pollen_type] = int(level["level"])
-            
-            return active_pollen
+            return normalize_pollen(data)
         except PollenDataAPIError as err:
             _LOGGER.error("Error getting pollen data for %s: %s", region, err)
             raise
 
-    async def get_forecast(self, region: str) -> Optional[str]:
+    async def get_forecast(
+        self, region: str, priority: int = PRIORITY_BACKGROUND
+    ) -> Optional[str]:
         """Get forecast text for a region."""
         try:
             endpoint = API_FORECAST.format(region=region)
-            data = await self._request(endpoint)
+            data = await self._request(endpoint, priority)
             
             if isinstance(data, str):
                 return data
@@ -128,39 +228,59 @@ class PollenDataAPI:
             _LOGGER.error("Error getting forecast for %s: %s", region, err)
             return None
 
-    async def get_combined_data(self, region: str) -> Dict[str, Any]:
-        """Get combined pollen data and forecast for a region."""
+    async def get_combined_data(
+        self,
+        region: str,
+        priority: int = PRIORITY_BACKGROUND,
+        pollen_types: Optional[List[str]] = None,
+        include_forecast: bool = True,
+    ) -> Dict[str, Any]:
+        """Get combined pollen data and forecast for a region.
+
+        The server is asked for active types only, and optionally for just
+        ``pollen_types`` and no forecast. The result is filtered the same way
+        here, since not every server honors these parameters.
+        """
         try:
             endpoint = API_COMBINED.format(region=region)
-            data = await self._request(endpoint)
+            params = self.transfer.selection_params(
+                pollen_types or (), include_forecast
+            )
+            try:
+                data = await self._request(endpoint, priority, params, detect=True)
+            except PollenDataAPIStatusError as err:
+                if not params or not 400 <= err.status < 500:
+                    raise
+                # Some hosts reject unknown parameters; retry once without them
+                data = await self._request(endpoint, priority, detect=True)
+                self.transfer.reject_selection(err.status)
+            else:
+                self.transfer.record_selection(params, data)
             
             if not isinstance(data, dict):
                 _LOGGER.error("Unexpected combined data response format: %s", data)
                 return {}
             
-            # Extract pollen data and filter active types
-            pollen_data = data.get("pollen", {})
-            active_pollen = {}
-            
-            for pollen_type, level in pollen_data.items():
-                if isinstance(level, (int, float)) and level > 0:
-                    active_pollen[pollen_type] = int(level)
-                elif isinstance(level, dict) and level.get("level", 0) > 0:
-                    active_pollen[pollen_type] = int(level["level"])
-            
-            return {
-                "pollen": active_pollen,
-                "forecast": data.get("forecast", ""),
-                "last_updated": data.get("last_updated", ""),
-            }
+            with self.stage_timer.stage("normalize"):
+                # Extract pollen data and filter active types
+                result = normalize_combined(data)
+                if pollen_types:
+                    result["pollen"] = {
+                        pollen_type: level
+                        for pollen_type, level in result["pollen"].items()
+                        if pollen_type in pollen_types
+                    }
+                if not include_forecast:
+                    result["forecast"] = ""
+            return result
         except PollenDataAPIError as err:
             _LOGGER.error("Error getting combined data for %s: %s", region, err)
             raise
 
-    async def test_connection(self) -> bool:
+    async def test_connection(self, priority: int = PRIORITY_BACKGROUND) -> bool:
         """Test connection to the API."""
         try:
-            await self.get_regions()
+            await self.get_regions(priority)
             return True
         except PollenDataAPIError:
             return False
\ No newline at end of file
@@ -5,7 +5,8 @@ from typing import Any, Dict, Optional
 import voluptuous as vol
 from homeassistant import config_entries, core, exceptions
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import PollenDataAPI, PollenDataAPIError
@@ -14,9 +15,12 @@ from .const import (
     CONF_HOSTNAME,
     CONF_REGION,
     CONF_POLLEN_TYPES,
+    CONF_ZONES,
     DEFAULT_HOSTNAME,
     COMMON_POLLEN_TYPES,
+    PRIORITY_SETUP,
 )
+from .regions import RegionIndex, load_region_index, match_region
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,12 +45,12 @@ async def validate_input(hass: core.HomeAssistant, data: dict) -> Dict[str, Any]
     api = PollenDataAPI(hostname=data[CONF_HOSTNAME], session=session)
     
     # Test connection
-    if not await api.test_connection():
+    if not await api.test_connection(PRIORITY_SETUP):
         raise CannotConnect
     
     # Get available regions
     try:
-        regions = await api.get_regions()
+        regions = await api.get_regions(PRIORITY_SETUP)
     except PollenDataAPIError as err:
         _LOGGER.error("Error getting regions: %s", err)
         raise CannotConnect from err
@@ -57,6 +61,27 @@ async def validate_input(hass: core.HomeAssistant, data: dict) -> Dict[str, Any]
     return {"regions": regions}
 
 
+def _zone_coordinates(hass: core.HomeAssistant) -> Dict[str, Dict[str, Any]]:
+    """Return name and coordinates of each zone, keyed by entity id."""
+    zones = {}
+    for state in hass.states.async_all("zone"):
+        latitude = state.attributes.get("latitude")
+        longitude = state.attributes.get("longitude")
+        if latitude is None or longitude is None:
+            continue
+        zones[state.entity_id] = {
+            "name": state.name,
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+    return zones
+
+
+def _host_key(hostname: str) -> str:
+    """Return the hostname in the form used to key per-host state."""
+    return hostname.rstrip("/").lower()
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pollen Data."""
 
@@ -66,6 +91,34 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize config flow."""
         self.regions = []
         self.hostname = ""
+        self.region_index: Optional[RegionIndex] = None
+
+    def _resolve_region(self, latitude: float, longitude: float) -> Optional[str]:
+        """Return the available region covering the coordinates, if any."""
+        if self.region_index is None:
+            return None
+        return match_region(
+            self.region_index.resolve(latitude, longitude), self.regions
+        )
+
+    def _entry_exists(self, region: str) -> bool:
+        """Return True if the host and region are already configured.
+
+        Also covers entries created before unique ids were set.
+        """
+        host = _host_key(self.hostname)
+        return any(
+            _host_key(entry.data.get(CONF_HOSTNAME, "")) == host
+            and entry.data.get(CONF_REGION) == region
+            for entry in self._async_current_entries()
+        )
+
+    async def _async_abort_if_configured(self, region: str) -> None:
+        """Abort the flow if the host and region are already configured."""
+        await self.async_set_unique_id(f"{_host_key(self.hostname)}_{region}")
+        self._abort_if_unique_id_configured()
+        if self._entry_exists(region):
+            raise AbortFlow("already_configured")
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -99,9 +152,32 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the region step."""
         errors = {}
+        zones = _zone_coordinates(self.hass)
         
         if user_input is not None:
             region = user_input[CONF_REGION]
+            await self._async_abort_if_configured(region)
+            
+            # Create one more entry for each region covering a selected zone
+            extra_regions = set()
+            for zone_id in user_input.get(CONF_ZONES, []):
+                zone = zones.get(zone_id)
+                zone_region = zone and self._resolve_region(
+                    zone["latitude"], zone["longitude"]
+                )
+                if not zone_region:
+                    _LOGGER.warning("No pollen region found for %s", zone_id)
+                elif zone_region != region and not self._entry_exists(zone_region):
+                    extra_regions.add(zone_region)
+            
+            for zone_region in sorted(extra_regions):
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={CONF_HOSTNAME: self.hostname, CONF_REGION: zone_region},
+                    )
+                )
             
             # Create entry with basic configuration
             title = f"Pollen Data ({region})"
@@ -112,19 +188,49 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             return self.async_create_entry(title=title, data=data)
 
-        # Create region selection schema
-        region_schema = vol.Schema(
-            {
-                vol.Required(CONF_REGION): vol.In(self.regions),
-            }
+        # Only offer regions this host is not configured for yet
+        available = [region for region in self.regions if not self._entry_exists(region)]
+        if not available:
+            return self.async_abort(reason="already_configured")
+
+        # Pre-select the region covering the home location, resolved offline
+        self.region_index = await self.hass.async_add_executor_job(load_region_index)
+        suggested = self._resolve_region(
+            self.hass.config.latitude, self.hass.config.longitude
         )
 
+        # Create region selection schema
+        fields = {}
+        if suggested in available:
+            fields[vol.Required(CONF_REGION, default=suggested)] = vol.In(available)
+        else:
+            fields[vol.Required(CONF_REGION)] = vol.In(available)
+        if zones:
+            fields[vol.Optional(CONF_ZONES, default=[])] = cv.multi_select(
+                {zone_id: zone["name"] for zone_id, zone in zones.items()}
+            )
+        region_schema = vol.Schema(fields)
+
         return self.async_show_form(
             step_id="region",
             data_schema=region_schema,
             errors=errors,
         )
 
+    async def async_step_import(self, import_data: Dict[str, Any]) -> FlowResult:
+        """Create an entry for a region started from another flow."""
+        self.hostname = import_data[CONF_HOSTNAME]
+        region = import_data[CONF_REGION]
+        await self._async_abort_if_configured(region)
+        
+        return self.async_create_entry(
+            title=f"Pollen Data ({region})",
+            data={
+                CONF_HOSTNAME: import_data[CONF_HOSTNAME],
+                CONF_REGION: region,
+            },
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
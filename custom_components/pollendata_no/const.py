@@ -6,11 +6,33 @@ DOMAIN = "pollendata_no"
 CONF_HOSTNAME = "hostname"
 CONF_REGION = "region"
 CONF_POLLEN_TYPES = "pollen_types"
+CONF_ZONES = "zones"
 
 # Default values
 DEFAULT_HOSTNAME = "localhost:8080"
 DEFAULT_SCAN_INTERVAL = 30  # minutes
 DEFAULT_TIMEOUT = 30  # seconds
+DEFAULT_MAX_CONCURRENT_REQUESTS = 2  # per host
+DEFAULT_REQUESTS_PER_MINUTE = 30  # per host, shared by all entries
+
+# Request priorities (lower is served first)
+PRIORITY_SETUP = 0
+PRIORITY_USER = 1
+PRIORITY_BACKGROUND = 2
+
+# Services
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_TIMEOUT = "timeout"
+DEFAULT_PROFILE_CYCLES = 1
+MAX_PROFILE_CYCLES = 20
+MAX_PROFILE_TIMEOUT = 24 * 60  # minutes
+PROFILE_TIMEOUT_MARGIN = 5  # minutes added to the default timeout
+
+# Offline region index
+REGION_INDEX_FILE = "regions_index.json"
+MAX_REGION_DISTANCE = 0.5  # degrees of latitude, about 55 km
 
 # API endpoints
 API_REGIONS = "/regions"
@@ -18,6 +40,11 @@ API_POLLEN = "/pollen/{region}"
 API_FORECAST = "/forecast/{region}"
 API_COMBINED = "/combined/{region}"
 
+# Optional query parameters narrowing /combined responses
+API_PARAM_ACTIVE = "active"
+API_PARAM_TYPES = "types"
+API_PARAM_FIELDS = "fields"
+
 # Pollen severity levels
 POLLEN_LEVELS = {
     0: "None",
@@ -56,6 +83,17 @@ POLLEN_NAME_MAPPING = {
     "burot": "mugwort"
 }
 
+# Maximum length of an entity state in Home Assistant
+MAX_STATE_LENGTH = 255
+
+# Static and derived attributes kept out of the recorder
+UNRECORDED_POLLEN_ATTRIBUTES = frozenset(
+    {"level_name", "level_threshold", "color", "pollen_type", "region"}
+)
+UNRECORDED_FORECAST_ATTRIBUTES = frozenset(
+    {"forecast", "region", "active_pollen_types"}
+)
+
 # Sensor device classes
 DEVICE_CLASS_POLLEN = "pollen"
 
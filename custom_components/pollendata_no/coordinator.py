@@ -1,9 +1,9 @@
 """Data update coordinator for Pollen Data."""
 from datetime import timedelta
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -14,6 +14,9 @@ from .const import (
     CONF_REGION,
     CONF_POLLEN_TYPES,
     DEFAULT_SCAN_INTERVAL,
+    PRIORITY_SETUP,
+    PRIORITY_USER,
+    PRIORITY_BACKGROUND,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +41,10 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
             hostname=hostname,
             session=async_get_clientsession(hass),
         )
+        self._request_priority = PRIORITY_BACKGROUND
+        self._profile_listeners: List[
+            Tuple[Optional[Callable[[], None]], Callable[[Dict[str, float]], None]]
+        ] = []
         
         super().__init__(
             hass,
@@ -45,39 +52,44 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(minutes=scan_interval),
         )
+        # Requested refreshes may be deferred by the debouncer's cooldown, so
+        # the priority is set by the refresh that actually runs
+        self._debounced_refresh.function = self._async_requested_refresh
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh data for the first time with setup priority."""
+        self._request_priority = PRIORITY_SETUP
+        await super().async_config_entry_first_refresh()
+
+    async def _async_requested_refresh(self) -> None:
+        """Run a requested refresh with user priority."""
+        self._request_priority = PRIORITY_USER
+        await self.async_refresh()
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data via library."""
+        # Scheduled refreshes fall back to background priority
+        priority = self._request_priority
+        self._request_priority = PRIORITY_BACKGROUND
+
         try:
             # Get combined data (pollen data + forecast)
-            combined_data = await self.api.get_combined_data(self.region)
+            combined_data = await self.api.get_combined_data(
+                self.region, priority, pollen_types=self.pollen_types
+            )
             
             if not combined_data:
                 raise UpdateFailed("No data received from API")
             
-            pollen_data = combined_data.get("pollen", {})
-            
-            # Filter by specific pollen types if configured
-            if self.pollen_types:
-                filtered_pollen = {}
-                for pollen_type in self.pollen_types:
-                    if pollen_type in pollen_data:
-                        filtered_pollen[pollen_type] = pollen_data[pollen_type]
-                pollen_data = filtered_pollen
-            
-            # Only include active pollen types (level > 0)
-            active_pollen = {
-                pollen_type: level
-                for pollen_type, level in pollen_data.items()
-                if level > 0
-            }
-            
-            result = {
-                "pollen": active_pollen,
-                "forecast": combined_data.get("forecast", ""),
-                "last_updated": combined_data.get("last_updated", ""),
-                "region": self.region,
-            }
+            # The API only returns active pollen types (level > 0), limited
+            # to the configured pollen types if any
+            with self.api.stage_timer.stage("filter"):
+                result = {
+                    "pollen": combined_data.get("pollen", {}),
+                    "forecast": combined_data.get("forecast", ""),
+                    "last_updated": combined_data.get("last_updated", ""),
+                    "region": self.region,
+                }
             
             _LOGGER.debug("Updated pollen data: %s", result)
             return result
@@ -89,17 +101,69 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Unexpected error updating data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing entity state writes."""
+        with self.api.stage_timer.stage("fan_out"):
+            super().async_update_listeners()
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, timing its stages while a profile is listening."""
+        listeners = list(self._profile_listeners)
+        if not listeners:
+            await super()._async_refresh(*args, **kwargs)
+            return
+
+        for on_start, _ in listeners:
+            if on_start is not None:
+                on_start()
+        self.api.stage_timer.start()
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            timings = self.api.stage_timer.stop()
+            for listener in listeners:
+                if listener in self._profile_listeners:
+                    listener[1](timings)
+
+    @callback
+    def async_add_profile_listener(
+        self,
+        on_finish: Callable[[Dict[str, float]], None],
+        on_start: Optional[Callable[[], None]] = None,
+    ) -> Callable[[], None]:
+        """Pass the stage timings of each following refresh to ``on_finish``.
+
+        ``on_start`` is called when such a refresh begins. Refreshes keep
+        their own trigger and priority. Returns a callback that removes the
+        listener.
+        """
+        listener = (on_start, on_finish)
+        self._profile_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._profile_listeners:
+                self._profile_listeners.remove(listener)
+
+        return remove_listener
+
+    @property
+    def profiling(self) -> bool:
+        """Return True while a profiled refresh is running."""
+        return self.api.stage_timer.enabled
+
     async def async_get_regions(self) -> List[str]:
         """Get available regions from API."""
         try:
-            return await self.api.get_regions()
+            return await self.api.get_regions(PRIORITY_USER)
         except PollenDataAPIError as err:
             _LOGGER.error("Error getting regions: %s", err)
             return []
 
     async def async_test_connection(self) -> bool:
         """Test connection to the API."""
-        return await self.api.test_connection()
+        return await self.api.test_connection(PRIORITY_SETUP)
 
     @property
     def available_pollen_types(self) -> List[str]:
@@ -127,4 +191,14 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
         """Get last updated time."""
         if not self.data or "last_updated" not in self.data:
             return ""
-        return self.data["last_updated"]
\ No newline at end of file
+        return self.data["last_updated"]
+
+    @property
+    def request_metrics(self) -> Dict[str, Any]:
+        """Get request queue metrics for the host."""
+        return self.api.limiter.metrics
+
+    @property
+    def transfer_metrics(self) -> Dict[str, Any]:
+        """Get compression and field selection metrics for the host."""
+        return self.api.transfer.metrics
@@ -0,0 +1,27 @@
+"""Diagnostics support for Pollen Data."""
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import PollenDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: PollenDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "hostname": coordinator.hostname,
+            "region": coordinator.region,
+            "pollen_types": coordinator.pollen_types,
+        },
+        "last_update_success": coordinator.last_update_success,
+        "data": coordinator.data,
+        "request_metrics": coordinator.request_metrics,
+        "transfer_metrics": coordinator.transfer_metrics,
+    }
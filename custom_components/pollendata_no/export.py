@@ -0,0 +1,199 @@
+"""Bulk NDJSON export of pollen data for all regions.
+
+Like ``api``, this module does not depend on Home Assistant. Run it with
+``scripts/pollendata-export``.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import json
+import logging
+import os
+import sys
+from typing import Dict, IO, List, Optional, Sequence
+
+from .api import PollenDataAPI, PollenDataAPIError
+from .const import (
+    DEFAULT_HOSTNAME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TIMEOUT,
+)
+from .limiter import HostLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def load_state(path: Optional[str]) -> Dict[str, str]:
+    """Load cached last_updated values per region."""
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Ignoring unreadable state file %s: %s", path, err)
+        return {}
+
+    return state if isinstance(state, dict) else {}
+
+
+def save_state(path: str, state: Dict[str, str]) -> None:
+    """Write cached last_updated values atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+async def _export_region(
+    api: PollenDataAPI,
+    region: str,
+    output: IO[str],
+    state: Optional[Dict[str, str]],
+    include_forecast: bool,
+) -> bool:
+    """Fetch one region and write its record, returning False on error."""
+    try:
+        data = await api.get_combined_data(region, include_forecast=include_forecast)
+    except PollenDataAPIError as err:
+        _LOGGER.error("Skipping region %s after error: %s", region, err)
+        return False
+
+    last_updated = data.get("last_updated")
+    if state is not None:
+        if last_updated and state.get(region) == last_updated:
+            _LOGGER.debug("Region %s unchanged since %s", region, last_updated)
+            return True
+        state[region] = last_updated
+
+    record = {
+        "region": region,
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        **data,
+    }
+    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    output.flush()
+    return True
+
+
+async def export(
+    api: PollenDataAPI,
+    output: IO[str],
+    state: Optional[Dict[str, str]] = None,
+    regions: Optional[Sequence[str]] = None,
+    include_forecast: bool = True,
+) -> int:
+    """Fetch all regions concurrently and write one JSON line per region.
+
+    Each record is written as soon as its region completes, so nothing is
+    buffered. Regions whose ``last_updated`` matches ``state`` are skipped;
+    ``state`` is updated in place. Returns the number of regions that failed.
+    """
+    if regions is None:
+        regions = await api.get_regions()
+
+    results = await asyncio.gather(
+        *(
+            _export_region(api, region, output, state, include_forecast)
+            for region in regions
+        )
+    )
+    return results.count(False)
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Export normalized pollen data for all regions as NDJSON.",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOSTNAME,
+        help=f"pollendata service hostname (default: {DEFAULT_HOSTNAME})",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to append records to, or - for stdout (default: -)",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="STATE_FILE",
+        help="skip regions whose last_updated matches this state file, "
+        "and update it after the run",
+    )
+    parser.add_argument(
+        "--region",
+        action="append",
+        dest="regions",
+        help="export only this region (can be repeated)",
+    )
+    parser.add_argument(
+        "--levels-only",
+        action="store_true",
+        help="leave out the forecast text",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help="maximum concurrent requests to the host",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=DEFAULT_REQUESTS_PER_MINUTE,
+        help="request budget per minute for the host",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT,
+        help="request timeout in seconds",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    return parser.parse_args(argv)
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    """Run the export."""
+    state = load_state(args.since) if args.since else None
+    limiter = HostLimiter(args.max_concurrent, args.requests_per_minute)
+
+    if args.output == "-":
+        output = sys.stdout
+    else:
+        output = open(args.output, "a", encoding="utf-8")
+
+    try:
+        async with PollenDataAPI(
+            args.host, timeout=args.timeout, limiter=limiter
+        ) as api:
+            failed = await export(
+                api, output, state, args.regions, not args.levels_only
+            )
+    except PollenDataAPIError as err:
+        _LOGGER.error("Export failed: %s", err)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if state is not None:
+        save_state(args.since, state)
+
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+    return asyncio.run(_async_main(args))
@@ -0,0 +1,146 @@
+"""Per-host request limiting for Pollen Data."""
+import asyncio
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    PRIORITY_BACKGROUND,
+)
+
+
+class HostLimiter:
+    """Limit concurrency and request rate towards a single host.
+
+    Callers wait in priority order (lower value first, FIFO within the same
+    priority) for both a free concurrency slot and a token from a bucket that
+    refills at ``requests_per_minute``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    ) -> None:
+        """Initialize the limiter."""
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = max(1, requests_per_minute)
+        self._rate = self.requests_per_minute / 60.0
+        self._tokens = float(self.requests_per_minute)
+        self._refilled_at = time.monotonic()
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Metrics
+        self._requests = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers currently waiting."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue and wait time metrics."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "requests_per_minute": self.requests_per_minute,
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "requests": self._requests,
+            "last_wait": round(self._last_wait, 3),
+            "max_wait": round(self._max_wait, 3),
+            "average_wait": round(self._total_wait / self._requests, 3)
+            if self._requests
+            else 0.0,
+        }
+
+    @asynccontextmanager
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> AsyncIterator[None]:
+        """Wait for a slot and a token, then hold the slot for the block."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        started = time.monotonic()
+        self._dispatch()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation, hand it back
+                self._release()
+            raise
+
+        waited = time.monotonic() - started
+        self._requests += 1
+        self._total_wait += waited
+        self._last_wait = waited
+        self._max_wait = max(self._max_wait, waited)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Free a concurrency slot and wake the next waiter."""
+        self._active -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.requests_per_minute),
+            self._tokens + (now - self._refilled_at) * self._rate,
+        )
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters while capacity and tokens are available."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters and self._active < self.max_concurrent:
+            _, _, waiter = self._waiters[0]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self._rate
+                self._timer = asyncio.get_running_loop().call_later(
+                    delay, self._dispatch
+                )
+                return
+
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            self._active += 1
+            waiter.set_result(None)
+
+
+_LIMITERS: Dict[str, HostLimiter] = {}
+
+
+def get_host_limiter(hostname: str) -> HostLimiter:
+    """Return the limiter shared by all clients talking to a host."""
+    key = hostname.rstrip("/").lower()
+    if key not in _LIMITERS:
+        _LIMITERS[key] = HostLimiter()
+    return _LIMITERS[key]
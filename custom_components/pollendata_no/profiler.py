@@ -0,0 +1,275 @@
+"""Opt-in profiling of refresh cycles for Pollen Data.
+
+This module does not depend on Home Assistant.
+"""
+from contextlib import contextmanager
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Refresh stages in the order they happen
+STAGES = ("queue", "fetch", "decode", "normalize", "filter", "fan_out")
+
+
+class StageTimer:
+    """Accumulate time spent in named stages while enabled.
+
+    Stages may nest; each stage is charged only for time not spent in the
+    stages nested inside it. A timer tracks a single refresh at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.enabled = False
+        self._totals: Dict[str, float] = {}
+        self._stack: List[List[Any]] = []
+
+    def start(self) -> None:
+        """Reset the totals and start recording."""
+        self._totals = {}
+        self._stack = []
+        self.enabled = True
+
+    def stop(self) -> Dict[str, float]:
+        """Stop recording and return seconds spent per stage."""
+        self.enabled = False
+        return self._totals
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as ``name``."""
+        if not self.enabled:
+            yield
+            return
+
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            if self._stack and self._stack[-1] is frame:
+                self._stack.pop()
+            if self._stack:
+                self._stack[-1][2] += elapsed
+            self._totals[name] = self._totals.get(name, 0.0) + elapsed - frame[2]
+
+
+def _label(code: Any) -> str:
+    """Return a short label for a code object."""
+    path = code.co_filename.split(os.sep)
+    return f"{os.sep.join(path[-2:])}:{code.co_firstlineno}({code.co_name})"
+
+
+class Sampler:
+    """Sample the call stack of one thread from a background thread.
+
+    When ``active`` is given, samples are only taken while it returns True.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval: float = 0.005,
+        max_depth: int = 64,
+        active: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Initialize the sampler."""
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_depth = max_depth
+        self.active = active
+        self.samples = 0
+        self._self_counts: Dict[str, int] = {}
+        self._total_counts: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pollendata_no_sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread (blocking)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Record the target thread's stack every interval."""
+        while not self._stop.wait(self.interval):
+            if self.active is not None and not self.active():
+                continue
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+            if frame is None:
+                continue
+
+            self.samples += 1
+            seen = set()
+            leaf = True
+            depth = 0
+            while frame is not None and depth < self.max_depth:
+                label = _label(frame.f_code)
+                if leaf:
+                    self._self_counts[label] = self._self_counts.get(label, 0) + 1
+                    leaf = False
+                if label not in seen:
+                    seen.add(label)
+                    self._total_counts[label] = self._total_counts.get(label, 0) + 1
+                frame = frame.f_back
+                depth += 1
+
+    def top(self, limit: int = 20) -> List[Tuple[str, int, int]]:
+        """Return (function, self samples, total samples), busiest first."""
+        functions = sorted(
+            self._total_counts,
+            key=lambda label: (self._self_counts.get(label, 0), self._total_counts[label]),
+            reverse=True,
+        )
+        return [
+            (label, self._self_counts.get(label, 0), self._total_counts[label])
+            for label in functions[:limit]
+        ]
+
+
+class MemoryTracer:
+    """Trace allocations only while at least one refresh is being profiled.
+
+    Each traced period is compared with a snapshot from its start, and the
+    changes are summed by line. Only files matching ``include`` (fnmatch
+    patterns) are kept, so allocations by unrelated code running on the
+    same event loop are left out.
+    """
+
+    def __init__(self, include: Sequence[str]) -> None:
+        """Initialize the tracer."""
+        self._filters = [tracemalloc.Filter(True, pattern) for pattern in include]
+        self._active = 0
+        self._started_tracing = False
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._changes: Dict[str, List[int]] = {}
+
+    def enter(self) -> None:
+        """Start tracing if no other profiled refresh is running."""
+        self._active += 1
+        if self._active > 1:
+            return
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline = self._snapshot()
+
+    def exit(self) -> Tuple[int, int]:
+        """Return current and peak traced memory, then stop if idle."""
+        traced = tracemalloc.get_traced_memory()
+        if self._active:
+            self._active -= 1
+            if not self._active:
+                self._finish()
+        return traced
+
+    def close(self) -> None:
+        """Stop tracing, even if refreshes are still running."""
+        if self._active:
+            self._active = 0
+            self._finish()
+
+    def top(self, limit: int = 20) -> List[Tuple[str, int, int]]:
+        """Return (location, size change, block change), largest first."""
+        changes = sorted(
+            self._changes.items(), key=lambda item: abs(item[1][0]), reverse=True
+        )
+        return [(location, size, count) for location, (size, count) in changes[:limit]]
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Return a snapshot limited to the included files."""
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _finish(self) -> None:
+        """Add the changes since the baseline and stop tracing."""
+        if self._baseline is not None:
+            for stat in self._snapshot().compare_to(self._baseline, "lineno"):
+                frame = stat.traceback[0]
+                change = self._changes.setdefault(
+                    f"{frame.filename}:{frame.lineno}", [0, 0]
+                )
+                change[0] += stat.size_diff
+                change[1] += stat.count_diff
+            self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def summarize_stages(
+    refreshes: List[Dict[str, float]]
+) -> Dict[str, Dict[str, float]]:
+    """Return mean and max milliseconds per stage across refreshes."""
+    summary = {}
+    for stage in STAGES:
+        values = [timings.get(stage, 0.0) * 1000 for timings in refreshes]
+        if not values:
+            continue
+        summary[stage] = {
+            "mean_ms": round(sum(values) / len(values), 3),
+            "max_ms": round(max(values), 3),
+        }
+    return summary
+
+
+def format_report(
+    refreshes: List[Tuple[str, Dict[str, float]]],
+    sampler: Sampler,
+    memory: List[Tuple[str, int, int]],
+    traced: List[Tuple[int, int]],
+    expected: int,
+) -> str:
+    """Return a plain-text profiling report.
+
+    ``refreshes`` holds a label and the stage timings of each captured
+    refresh, ``traced`` the traced memory at the end of each of them, and
+    ``expected`` the number of refreshes the profile waited for.
+    """
+    lines = [
+        f"Pollen Data profile: {len(refreshes)} of {expected} refresh(es) captured",
+        "",
+    ]
+
+    lines.append("Stage timings (ms)")
+    lines.append(f"{'refresh':<24}" + "".join(f"{stage:>11}" for stage in STAGES))
+    for label, timings in refreshes:
+        lines.append(
+            f"{label[:23]:<24}"
+            + "".join(f"{timings.get(stage, 0.0) * 1000:>11.3f}" for stage in STAGES)
+        )
+    lines.append("")
+
+    lines.append(
+        f"Sampled call stacks: {sampler.samples} samples "
+        f"every {sampler.interval * 1000:.0f} ms"
+    )
+    lines.append(f"{'self':>7}{'total':>7}  function")
+    for label, self_count, total_count in sampler.top():
+        lines.append(f"{self_count:>7}{total_count:>7}  {label}")
+    lines.append("")
+
+    lines.append("Traced memory at the end of each refresh (bytes)")
+    lines.append(f"{'refresh':<9}{'current':>12}{'peak':>12}")
+    for number, (current, peak) in enumerate(traced, 1):
+        lines.append(f"{number:<9}{current:>12}{peak:>12}")
+    lines.append("")
+
+    lines.append("Largest allocation changes during profiled refreshes")
+    lines.append(f"{'bytes':>10}{'blocks':>8}  location")
+    for location, size_diff, count_diff in memory:
+        lines.append(f"{size_diff:>10}{count_diff:>8}  {location}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,130 @@
+"""Offline resolution of coordinates to NAAF forecast regions.
+
+The bundled index holds simplified region outlines and a grid of bounding
+box cells, built by ``scripts/build_region_index.py``. This module does not
+depend on Home Assistant.
+"""
+from functools import lru_cache
+import json
+import math
+import os
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .const import MAX_REGION_DISTANCE, REGION_INDEX_FILE
+
+Point = Tuple[float, float]
+
+
+def _contains(polygon: Sequence[Sequence[float]], lon: float, lat: float) -> bool:
+    """Return True if the point is inside the polygon (ray casting)."""
+    inside = False
+    count = len(polygon)
+    for i in range(count):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % count]
+        if (y1 > lat) != (y2 > lat):
+            if lon < (x2 - x1) * (lat - y1) / (y2 - y1) + x1:
+                inside = not inside
+    return inside
+
+
+def _distance(polygon: Sequence[Sequence[float]], lon: float, lat: float) -> float:
+    """Return the distance in degrees of latitude from the point to the outline."""
+    scale = math.cos(math.radians(lat))
+    px, py = lon * scale, lat
+    best = math.inf
+    count = len(polygon)
+    for i in range(count):
+        x1, y1 = polygon[i][0] * scale, polygon[i][1]
+        x2, y2 = polygon[(i + 1) % count][0] * scale, polygon[(i + 1) % count][1]
+        dx, dy = x2 - x1, y2 - y1
+        length = dx * dx + dy * dy
+        t = 0.0 if length == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length))
+        best = min(best, math.hypot(px - (x1 + t * dx), py - (y1 + t * dy)))
+    return best
+
+
+class RegionIndex:
+    """Resolve latitude/longitude to a region without network access."""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """Initialize the index from its JSON representation."""
+        self.cell = float(data["cell"])
+        self.origin: Point = tuple(data["origin"])
+        self.regions: List[Dict[str, Any]] = data["regions"]
+        self.grid: Dict[str, List[int]] = data["grid"]
+
+    @classmethod
+    def from_file(cls, path: str) -> "RegionIndex":
+        """Load an index from a JSON file."""
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    @property
+    def names(self) -> List[str]:
+        """Return the names of all regions in the index."""
+        return [region["name"] for region in self.regions]
+
+    def _cell_key(self, lat: float, lon: float) -> str:
+        """Return the grid key of the cell containing the point."""
+        col = math.floor((lon - self.origin[0]) / self.cell)
+        row = math.floor((lat - self.origin[1]) / self.cell)
+        return f"{col},{row}"
+
+    def resolve(
+        self, lat: float, lon: float, max_distance: float = MAX_REGION_DISTANCE
+    ) -> Optional[str]:
+        """Return the region containing the point.
+
+        Points just outside every outline (islands, coastline simplified
+        away) resolve to the nearest region within ``max_distance`` degrees.
+        """
+        for index in self.grid.get(self._cell_key(lat, lon), []):
+            region = self.regions[index]
+            min_lon, min_lat, max_lon, max_lat = region["bbox"]
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            if any(_contains(polygon, lon, lat) for polygon in region["polygons"]):
+                return region["name"]
+
+        nearest = None
+        nearest_distance = max_distance
+        for region in self.regions:
+            min_lon, min_lat, max_lon, max_lat = region["bbox"]
+            if not (
+                min_lat - max_distance <= lat <= max_lat + max_distance
+                and min_lon - 2 * max_distance <= lon <= max_lon + 2 * max_distance
+            ):
+                continue
+            for polygon in region["polygons"]:
+                distance = _distance(polygon, lon, lat)
+                if distance <= nearest_distance:
+                    nearest, nearest_distance = region["name"], distance
+        return nearest
+
+
+def _slug(name: str) -> str:
+    """Return a comparable form of a region name."""
+    name = name.casefold().replace("æ", "ae").replace("ø", "o").replace("å", "a")
+    name = unicodedata.normalize("NFKD", name)
+    return "".join(char for char in name if char.isalnum())
+
+
+def match_region(name: Optional[str], regions: Iterable[str]) -> Optional[str]:
+    """Return the entry in ``regions`` naming the same region as ``name``."""
+    if not name:
+        return None
+    slug = _slug(name)
+    for region in regions:
+        if _slug(region) == slug:
+            return region
+    return None
+
+
+@lru_cache(maxsize=1)
+def load_region_index() -> RegionIndex:
+    """Load the bundled region index (blocking, run in an executor)."""
+    return RegionIndex.from_file(
+        os.path.join(os.path.dirname(__file__), REGION_INDEX_FILE)
+    )
@@ -16,8 +16,11 @@ from .const import (
     POLLEN_ICONS,
     POLLEN_COLORS,
     POLLEN_NAME_MAPPING,
+    UNRECORDED_POLLEN_ATTRIBUTES,
+    UNRECORDED_FORECAST_ATTRIBUTES,
 )
 from .coordinator import PollenDataUpdateCoordinator
+from .util import summarize_forecast
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +64,8 @@ async def async_setup_entry(
 class PollenSensor(CoordinatorEntity, SensorEntity):
     """Sensor for individual pollen types."""
 
+    _unrecorded_attributes = UNRECORDED_POLLEN_ATTRIBUTES
+
     def __init__(
         self,
         coordinator: PollenDataUpdateCoordinator,
@@ -129,7 +134,13 @@ class PollenSensor(CoordinatorEntity, SensorEntity):
 
 
 class PollenForecastSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for pollen forecast text."""
+    """Sensor for pollen forecast text.
+
+    The state holds the first line of the forecast; the full text is in the
+    unrecorded ``forecast`` attribute.
+    """
+
+    _unrecorded_attributes = UNRECORDED_FORECAST_ATTRIBUTES
 
     def __init__(
         self,
@@ -151,12 +162,13 @@ class PollenForecastSensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data:
             return None
         
-        return self.coordinator.data.get("forecast", "")
+        return summarize_forecast(self.coordinator.data.get("forecast", ""))
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the state attributes."""
         return {
+            "forecast": self.coordinator.forecast_text,
             "region": self.region,
             "last_updated": self.coordinator.last_updated_time,
             "active_pollen_types": list(self.coordinator.available_pollen_types),
@@ -0,0 +1,209 @@
+"""Services for Pollen Data."""
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    SERVICE_PROFILE,
+    ATTR_CYCLES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_TIMEOUT,
+    DEFAULT_PROFILE_CYCLES,
+    MAX_PROFILE_CYCLES,
+    MAX_PROFILE_TIMEOUT,
+    PROFILE_TIMEOUT_MARGIN,
+)
+from .coordinator import PollenDataUpdateCoordinator
+from .profiler import MemoryTracer, Sampler, format_report, summarize_stages
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TIMEOUT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_TIMEOUT)
+        ),
+    }
+)
+
+# Number of entries in the service response; the report file has more
+SUMMARY_SIZE = 5
+
+# Allocations are only traced in the code a refresh runs through
+TRACED_FILES = tuple(
+    os.path.join(os.path.dirname(module.__file__), "*")
+    for module in (aiohttp, json)
+) + (os.path.join(os.path.dirname(__file__), "*"),)
+
+
+def _write_report(path: str, report: str) -> None:
+    """Write the report file (blocking)."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(report)
+
+
+async def _async_profile(
+    hass: HomeAssistant,
+    cycles: int,
+    entry_id: Optional[str],
+    timeout: Optional[int],
+) -> ServiceResponse:
+    """Profile the next refresh cycles and write a report.
+
+    Refreshes are not triggered here: scheduled and requested refreshes run
+    as usual, with their own priority and limiter contention, until each
+    entry has refreshed ``cycles`` times or ``timeout`` minutes pass.
+    """
+    coordinators: Dict[str, PollenDataUpdateCoordinator] = dict(
+        hass.data.get(DOMAIN, {})
+    )
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise HomeAssistantError(f"Pollen Data entry {entry_id} is not loaded")
+        coordinators = {entry_id: coordinators[entry_id]}
+    if not coordinators:
+        raise HomeAssistantError("No Pollen Data entries are loaded")
+
+    if timeout is None:
+        interval = max(
+            coordinator.update_interval.total_seconds() / 60
+            for coordinator in coordinators.values()
+        )
+        timeout = int(cycles * interval) + PROFILE_TIMEOUT_MARGIN
+
+    refreshes: List[Tuple[str, Dict[str, float]]] = []
+    traced: List[Tuple[int, int]] = []
+    remaining = {entry: cycles for entry in coordinators}
+    running = {entry: 0 for entry in coordinators}
+    done = asyncio.Event()
+    tracer = MemoryTracer(TRACED_FILES)
+    # Only sample while a profiled refresh runs, not the idle wait between them
+    sampler = Sampler(
+        threading.get_ident(),
+        active=lambda: any(
+            coordinator.profiling for coordinator in coordinators.values()
+        ),
+    )
+
+    def _listeners(
+        entry: str, region: str
+    ) -> Tuple[Callable[[Dict[str, float]], None], Callable[[], None]]:
+        """Return listeners recording refreshes of one entry."""
+
+        @callback
+        def start() -> None:
+            if remaining[entry]:
+                running[entry] += 1
+                tracer.enter()
+
+        @callback
+        def record(timings: Dict[str, float]) -> None:
+            if not running[entry]:
+                return
+            running[entry] -= 1
+            memory = tracer.exit()
+            if not remaining[entry]:
+                return
+            remaining[entry] -= 1
+            refreshes.append((region, dict(timings)))
+            traced.append(memory)
+            if not any(remaining.values()):
+                done.set()
+
+        return record, start
+
+    sampler.start()
+    unsubscribe = [
+        coordinator.async_add_profile_listener(*_listeners(entry, coordinator.region))
+        for entry, coordinator in coordinators.items()
+    ]
+    try:
+        await asyncio.wait_for(done.wait(), timeout * 60)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Pollen Data profile timed out after %s minutes with %s of %s "
+            "refreshes captured",
+            timeout,
+            len(refreshes),
+            cycles * len(coordinators),
+        )
+    finally:
+        for remove_listener in unsubscribe:
+            remove_listener()
+        tracer.close()
+        await hass.async_add_executor_job(sampler.stop)
+    memory = tracer.top()
+
+    path = hass.config.path(f"{DOMAIN}_profile_{dt_util.utcnow():%Y%m%d_%H%M%S}.txt")
+    await hass.async_add_executor_job(
+        _write_report,
+        path,
+        format_report(
+            refreshes, sampler, memory, traced, cycles * len(coordinators)
+        ),
+    )
+    _LOGGER.info("Wrote Pollen Data profile to %s", path)
+
+    return {
+        "report": path,
+        "cycles": cycles,
+        "timeout": timeout,
+        "refreshes": len(refreshes),
+        "expected_refreshes": cycles * len(coordinators),
+        "stages": summarize_stages([timings for _, timings in refreshes]),
+        "samples": sampler.samples,
+        "top_functions": [
+            {"function": label, "self": self_count, "total": total_count}
+            for label, self_count, total_count in sampler.top(SUMMARY_SIZE)
+        ],
+        "memory": [
+            {"location": location, "size_diff": size_diff, "count_diff": count_diff}
+            for location, size_diff, count_diff in memory[:SUMMARY_SIZE]
+        ],
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Pollen Data services."""
+    lock = asyncio.Lock()
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Handle the profile service call."""
+        if lock.locked():
+            raise HomeAssistantError("A Pollen Data profile is already running")
+        async with lock:
+            return await _async_profile(
+                hass,
+                call.data[ATTR_CYCLES],
+                call.data.get(ATTR_CONFIG_ENTRY_ID),
+                call.data.get(ATTR_TIMEOUT),
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,159 @@
+"""Per-host transfer capabilities and statistics for Pollen Data."""
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from .const import API_PARAM_ACTIVE, API_PARAM_FIELDS, API_PARAM_TYPES
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    import brotlicffi  # noqa: F401  pylint: disable=unused-import
+
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotli  # noqa: F401  pylint: disable=unused-import
+
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+# aiohttp can only decode brotli when one of the packages above is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+COMPRESSED_ENCODINGS = {"gzip", "deflate", "br"}
+
+
+class HostTransfer:
+    """Track what a host supports and how many bytes it sends.
+
+    Support for compression and for the field-selection query parameters is
+    ``None`` until a combined response shows it either way. Small replies
+    such as ``/regions`` are often sent uncompressed regardless, so only
+    combined responses are used. A compressed reply, or a reply that ignores
+    the selection parameters, overrides an earlier result.
+    """
+
+    def __init__(self, hostname: str) -> None:
+        """Initialize the tracker."""
+        self.hostname = hostname
+        self.compression: Optional[bool] = None
+        self.field_selection: Optional[bool] = None
+        self._responses = 0
+        self._compressed_responses = 0
+        self._wire_bytes = 0
+        self._decoded_bytes = 0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return transfer metrics."""
+        return {
+            "compression": self.compression,
+            "field_selection": self.field_selection,
+            "responses": self._responses,
+            "compressed_responses": self._compressed_responses,
+            "wire_bytes": self._wire_bytes,
+            "decoded_bytes": self._decoded_bytes,
+            "compression_bytes_saved": self._decoded_bytes - self._wire_bytes,
+        }
+
+    def selection_params(
+        self, pollen_types: Iterable[str] = (), include_forecast: bool = True
+    ) -> Dict[str, str]:
+        """Return query parameters narrowing a combined response.
+
+        Returns nothing once the host has been seen to ignore them.
+        """
+        if self.field_selection is False:
+            return {}
+
+        params = {API_PARAM_ACTIVE: "1"}
+        pollen_types = sorted(pollen_types)
+        if pollen_types:
+            params[API_PARAM_TYPES] = ",".join(pollen_types)
+        if not include_forecast:
+            params[API_PARAM_FIELDS] = "pollen,last_updated"
+        return params
+
+    def record_response(
+        self,
+        encoding: Optional[str],
+        content_length: Optional[int],
+        decoded: int,
+        detect: bool = False,
+    ) -> None:
+        """Record the size of a response and whether it was compressed.
+
+        Only responses recorded with ``detect`` decide compression support.
+        """
+        compressed = (encoding or "").lower() in COMPRESSED_ENCODINGS
+        wire = content_length if compressed and content_length is not None else decoded
+
+        self._responses += 1
+        self._wire_bytes += wire
+        self._decoded_bytes += decoded
+        if compressed:
+            self._compressed_responses += 1
+
+        if not detect or decoded == 0 or self.compression is True:
+            return
+        if self.compression is None or compressed:
+            self.compression = compressed
+            _LOGGER.debug(
+                "Host %s %s compressed responses",
+                self.hostname,
+                "supports" if compressed else "does not send",
+            )
+
+    def record_selection(self, params: Dict[str, str], data: Any) -> None:
+        """Decide from a combined response whether selection parameters work."""
+        if not params or self.field_selection is False or not isinstance(data, dict):
+            return
+
+        pollen = data.get("pollen")
+        honored: Optional[bool] = None
+        if isinstance(pollen, dict) and pollen:
+            requested = params.get(API_PARAM_TYPES)
+            if requested and set(pollen) - set(requested.split(",")):
+                honored = False
+            else:
+                # A reply to active=1 without inactive types counts as honored
+                honored = not any(_level(value) == 0 for value in pollen.values())
+        if API_PARAM_FIELDS in params and honored is not False:
+            honored = "forecast" not in data
+
+        if honored is not None and honored != self.field_selection:
+            self.field_selection = honored
+            _LOGGER.debug(
+                "Host %s %s field selection",
+                self.hostname,
+                "supports" if honored else "ignores",
+            )
+
+
+    def reject_selection(self, status: int) -> None:
+        """Record that the host rejected the selection parameters."""
+        if self.field_selection is not False:
+            self.field_selection = False
+            _LOGGER.debug(
+                "Host %s rejects field selection with status %s",
+                self.hostname,
+                status,
+            )
+
+
+def _level(value: Any) -> Any:
+    """Return the numeric level of a raw pollen value."""
+    if isinstance(value, dict):
+        return value.get("level", 0)
+    return value
+
+
+_TRANSFERS: Dict[str, HostTransfer] = {}
+
+
+def get_host_transfer(hostname: str) -> HostTransfer:
+    """Return the transfer tracker shared by all clients talking to a host."""
+    key = hostname.rstrip("/").lower()
+    if key not in _TRANSFERS:
+        _TRANSFERS[key] = HostTransfer(key)
+    return _TRANSFERS[key]
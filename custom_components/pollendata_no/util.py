@@ -0,0 +1,16 @@
+"""Entity state helpers for Pollen Data.
+
+This module does not depend on Home Assistant.
+"""
+from .const import MAX_STATE_LENGTH
+
+
+def summarize_forecast(forecast: str) -> str:
+    """Return the first non-empty line of a forecast, truncated to fit a state."""
+    for line in forecast.splitlines():
+        line = line.strip()
+        if line:
+            if len(line) > MAX_STATE_LENGTH:
+                return line[: MAX_STATE_LENGTH - 1] + "…"
+            return line
+    return ""
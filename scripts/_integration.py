@@ -0,0 +1,25 @@
+"""Load the integration's HA-independent modules from scripts."""
+import importlib
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+PACKAGE = "pollendata_no"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+
+def import_module(name: str) -> ModuleType:
+    """Import a submodule of the integration without running its __init__.
+
+    The package ``__init__`` requires Home Assistant; modules such as ``api``,
+    ``const`` and ``export`` do not.
+    """
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE,
+            PACKAGE_DIR / "__init__.py",
+            submodule_search_locations=[str(PACKAGE_DIR)],
+        )
+        sys.modules[PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{PACKAGE}.{name}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Build the bundled region index from a GeoJSON file of NAAF regions.
+
+Each feature needs a ``name`` property matching the NAAF region name and a
+Polygon or MultiPolygon geometry. Outlines are simplified with
+Douglas-Peucker, coordinates are rounded, and every grid cell lists the
+regions whose bounding box overlaps it.
+
+    scripts/build_region_index.py scripts/data/naaf_regions.geojson
+"""
+import argparse
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCE = ROOT / "scripts" / "data" / "naaf_regions.geojson"
+DEFAULT_OUTPUT = ROOT / "custom_components" / "pollendata_no" / "regions_index.json"
+
+
+def _point_line_distance(point: Sequence[float], start: Sequence[float], end: Sequence[float]) -> float:
+    """Return the distance from a point to a segment."""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = dx * dx + dy * dy
+    if length == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+    t = max(0.0, min(1.0, ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length))
+    return math.hypot(point[0] - (start[0] + t * dx), point[1] - (start[1] + t * dy))
+
+
+def simplify(points: List[List[float]], tolerance: float) -> List[List[float]]:
+    """Simplify a line with the Douglas-Peucker algorithm."""
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        index, distance = first, 0.0
+        for i in range(first + 1, last):
+            current = _point_line_distance(points[i], points[first], points[last])
+            if current > distance:
+                index, distance = i, current
+        if distance > tolerance:
+            keep[index] = True
+            stack.extend(((first, index), (index, last)))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _outer_rings(geometry: Dict[str, Any]) -> List[List[List[float]]]:
+    """Return the outer rings of a Polygon or MultiPolygon."""
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"][0]]
+    if geometry["type"] == "MultiPolygon":
+        return [polygon[0] for polygon in geometry["coordinates"]]
+    raise ValueError(f"Unsupported geometry type {geometry['type']}")
+
+
+def build(source: Dict[str, Any], tolerance: float, cell: float, precision: int) -> Dict[str, Any]:
+    """Return the index for a GeoJSON FeatureCollection."""
+    regions = []
+    for feature in source["features"]:
+        polygons = []
+        for ring in _outer_rings(feature["geometry"]):
+            # Rings repeat their first point; the index leaves them open
+            ring = simplify(ring, tolerance)[:-1]
+            if len(ring) >= 3:
+                polygons.append(
+                    [[round(lon, precision), round(lat, precision)] for lon, lat in ring]
+                )
+
+        lons = [lon for polygon in polygons for lon, _ in polygon]
+        lats = [lat for polygon in polygons for _, lat in polygon]
+        regions.append(
+            {
+                "name": feature["properties"]["name"],
+                "bbox": [min(lons), min(lats), max(lons), max(lats)],
+                "polygons": polygons,
+            }
+        )
+
+    origin = [
+        math.floor(min(region["bbox"][0] for region in regions)),
+        math.floor(min(region["bbox"][1] for region in regions)),
+    ]
+    grid: Dict[str, List[int]] = {}
+    for index, region in enumerate(regions):
+        min_lon, min_lat, max_lon, max_lat = region["bbox"]
+        for col in range(
+            math.floor((min_lon - origin[0]) / cell),
+            math.floor((max_lon - origin[0]) / cell) + 1,
+        ):
+            for row in range(
+                math.floor((min_lat - origin[1]) / cell),
+                math.floor((max_lat - origin[1]) / cell) + 1,
+            ):
+                grid.setdefault(f"{col},{row}", []).append(index)
+
+    return {"version": 1, "cell": cell, "origin": origin, "regions": regions, "grid": grid}
+
+
+def main() -> None:
+    """Build the index and write it next to the integration."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=str(DEFAULT_SOURCE))
+    parser.add_argument("-o", "--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--tolerance", type=float, default=0.01, help="degrees")
+    parser.add_argument("--cell", type=float, default=1.0, help="grid cell size in degrees")
+    parser.add_argument("--precision", type=int, default=3, help="coordinate decimals")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as file:
+        source = json.load(file)
+
+    index = build(source, args.tolerance, args.cell, args.precision)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(index, file, ensure_ascii=False, separators=(",", ":"))
+        file.write("\n")
+
+    vertices = sum(len(p) for region in index["regions"] for p in region["polygons"])
+    print(
+        f"{len(index['regions'])} regions, {vertices} vertices, "
+        f"{len(index['grid'])} grid cells -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
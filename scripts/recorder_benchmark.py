@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Estimate recorder rows and bytes per day for the pollen entities.
+
+Replays a simulated pollen season through a small model of the Home
+Assistant recorder and compares the attributes recorded before and after
+unrecorded attributes were introduced:
+
+* a ``states`` row is written whenever an entity's state or attributes change
+  (and once per entity on every restart);
+* a ``state_attributes`` row is written for each distinct set of recorded
+  attributes, deduplicated by content.
+
+Bytes count the state strings and the recorded attribute JSON; fixed-size
+columns (ids, timestamps) are identical in both runs and left out.
+
+    scripts/recorder_benchmark.py --days 30
+"""
+import argparse
+import json
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from _integration import import_module
+
+const = import_module("const")
+util = import_module("util")
+
+FORECAST_TEMPLATE = (
+    "{level_name} spredning av {name}pollen i dag og i morgen.\n"
+    "Det er ventet tørt og varmt vær, som gir gode forhold for "
+    "pollenspredning de neste dagene.\n"
+    "Personer med allergi bør følge med på varslene og ta forholdsregler."
+)
+
+# (state, attributes, written because of a restart)
+Snapshot = Tuple[str, Dict[str, Any], bool]
+
+REFRESHES_PER_DAY = 24 * 60 // const.DEFAULT_SCAN_INTERVAL
+
+
+def pollen_attributes(
+    pollen_type: str, level: int, region: str, last_updated: str
+) -> Dict[str, Any]:
+    """Return the attributes a pollen sensor writes.
+
+    Mirrors ``PollenSensor`` in ``sensor.py`` (extra state attributes plus
+    the entity attributes); keep both in sync.
+    """
+    name = const.POLLEN_NAME_MAPPING.get(pollen_type, pollen_type)
+    return {
+        "state_class": "measurement",
+        "level_name": const.POLLEN_LEVELS.get(level, "Unknown"),
+        "level_threshold": const.POLLEN_THRESHOLDS.get(level, "Unknown"),
+        "color": const.POLLEN_COLORS.get(level, "#000000"),
+        "pollen_type": pollen_type,
+        "region": region,
+        "last_updated": last_updated,
+        "unit_of_measurement": "level",
+        "icon": const.POLLEN_ICONS.get(pollen_type, const.POLLEN_ICONS["default"]),
+        "friendly_name": f"Pollen {name.title()}",
+    }
+
+
+def forecast_attributes(
+    forecast: str, levels: Dict[str, int], region: str, last_updated: str
+) -> Dict[str, Any]:
+    """Return the attributes the forecast sensor writes.
+
+    Mirrors ``PollenForecastSensor`` in ``sensor.py``; keep both in sync.
+    """
+    return {
+        "forecast": forecast,
+        "region": region,
+        "last_updated": last_updated,
+        "active_pollen_types": [pollen for pollen, level in levels.items() if level],
+        "icon": "mdi:weather-partly-cloudy",
+        "friendly_name": "Pollen Forecast",
+    }
+
+
+def simulate(args: argparse.Namespace) -> Dict[str, List[Snapshot]]:
+    """Return the states each entity writes over the simulated period."""
+    rng = random.Random(args.seed)
+    publish_every = REFRESHES_PER_DAY // args.updates_per_day
+    restart_every = (
+        REFRESHES_PER_DAY // args.restarts_per_day if args.restarts_per_day else 0
+    )
+
+    levels = {pollen: rng.randint(1, 4) for pollen in const.COMMON_POLLEN_TYPES}
+    forecast = ""
+    last_updated = ""
+    writes: Dict[str, List[Snapshot]] = {}
+
+    for tick in range(args.days * REFRESHES_PER_DAY):
+        if tick % publish_every == 0:
+            # The service publishes a new forecast; levels drift by one step
+            for pollen in levels:
+                levels[pollen] = min(4, max(1, levels[pollen] + rng.choice((-1, 0, 1))))
+            top = max(levels, key=levels.get)
+            forecast = FORECAST_TEMPLATE.format(
+                level_name=const.POLLEN_LEVELS[levels[top]],
+                name=const.POLLEN_NAME_MAPPING[top],
+            )
+            hours, minutes = divmod(tick * const.DEFAULT_SCAN_INTERVAL, 60)
+            last_updated = f"day {hours // 24} {hours % 24:02d}:{minutes:02d}"
+
+        # Restarts happen between publications and rewrite every state
+        restart = bool(restart_every) and tick % restart_every == restart_every - 1
+
+        for pollen, level in levels.items():
+            writes.setdefault(pollen, []).append(
+                (
+                    str(level),
+                    pollen_attributes(pollen, level, args.region, last_updated),
+                    restart,
+                )
+            )
+        writes.setdefault("forecast", []).append(
+            (
+                forecast,
+                forecast_attributes(forecast, levels, args.region, last_updated),
+                restart,
+            )
+        )
+
+    return writes
+
+
+def record(
+    writes: Dict[str, List[Snapshot]],
+    state_of: Callable[[str, str], str],
+    unrecorded: Callable[[str], frozenset],
+) -> Dict[str, int]:
+    """Replay writes through the recorder model and count rows and bytes."""
+    totals = {"states": 0, "state_attributes": 0, "bytes": 0}
+    seen_attributes = set()
+
+    for entity, snapshots in writes.items():
+        previous = None
+        for state, attributes, restart in snapshots:
+            state = state_of(entity, state)
+            shared_attrs = json.dumps(
+                {
+                    key: value
+                    for key, value in attributes.items()
+                    if key not in unrecorded(entity)
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            current = (state, shared_attrs)
+            if current == previous and not restart:
+                continue
+            previous = current
+
+            totals["states"] += 1
+            totals["bytes"] += len(state.encode())
+            if shared_attrs not in seen_attributes:
+                seen_attributes.add(shared_attrs)
+                totals["state_attributes"] += 1
+                totals["bytes"] += len(shared_attrs.encode())
+
+    return totals
+
+
+def _bounded_int(minimum: int, maximum: int) -> Callable[[str], int]:
+    """Return an argparse type accepting integers in [minimum, maximum]."""
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if not minimum <= number <= maximum:
+            raise argparse.ArgumentTypeError(
+                f"must be between {minimum} and {maximum}"
+            )
+        return number
+
+    return parse
+
+
+def _rate(allow_zero: bool) -> Callable[[str], int]:
+    """Return an argparse type accepting events per day.
+
+    Only divisors of the refreshes per day are accepted, so the simulated
+    rate is exactly the requested one.
+    """
+    rates = [n for n in range(1, REFRESHES_PER_DAY + 1) if REFRESHES_PER_DAY % n == 0]
+    if allow_zero:
+        rates.insert(0, 0)
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if number not in rates:
+            raise argparse.ArgumentTypeError(
+                f"must be one of {', '.join(map(str, rates))}"
+            )
+        return number
+
+    return parse
+
+
+def _check_unrecorded() -> None:
+    """Fail if an unrecorded attribute is missing from the simulated sets."""
+    checks = (
+        (const.UNRECORDED_POLLEN_ATTRIBUTES, pollen_attributes("bjork", 1, "", "")),
+        (const.UNRECORDED_FORECAST_ATTRIBUTES, forecast_attributes("", {}, "", "")),
+    )
+    for unrecorded, attributes in checks:
+        missing = unrecorded - attributes.keys()
+        if missing:
+            raise SystemExit(
+                f"Attributes {sorted(missing)} are not simulated; "
+                "update the benchmark to match sensor.py"
+            )
+
+
+def main() -> None:
+    """Run the benchmark and print a per-day comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=_bounded_int(1, 3650), default=30)
+    parser.add_argument(
+        "--updates-per-day", type=_rate(allow_zero=False), default=2
+    )
+    parser.add_argument(
+        "--restarts-per-day", type=_rate(allow_zero=True), default=1
+    )
+    parser.add_argument("--region", default="Østlandet med Oslo")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    _check_unrecorded()
+
+    writes = simulate(args)
+    before = record(
+        writes,
+        state_of=lambda entity, state: state,
+        unrecorded=lambda entity: frozenset(),
+    )
+    after = record(
+        writes,
+        state_of=lambda entity, state: (
+            util.summarize_forecast(state) if entity == "forecast" else state
+        ),
+        unrecorded=lambda entity: (
+            const.UNRECORDED_FORECAST_ATTRIBUTES
+            if entity == "forecast"
+            else const.UNRECORDED_POLLEN_ATTRIBUTES
+        ),
+    )
+
+    print(
+        f"{len(writes)} entities, {args.days} days, "
+        f"{args.updates_per_day} updates/day, {args.restarts_per_day} restarts/day"
+    )
+    print(f"{'per day':<22}{'before':>10}{'after':>10}{'change':>10}")
+    for key in ("states", "state_attributes", "bytes"):
+        old = before[key] / args.days
+        new = after[key] / args.days
+        change = (new - old) / old * 100 if old else 0.0
+        label = f"{key} rows" if key != "bytes" else "bytes"
+        print(f"{label:<22}{old:>10.1f}{new:>10.1f}{change:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,162 @@
+const SPARKLINE_HOURS = 168; // 7 days
+const SPARKLINE_RETRY_MS = 5 * 60 * 1000;
+const SPARKLINE_BATCH_MS = 100;
+const SPARKLINE_WIDTH = 80;
+const SPARKLINE_HEIGHT = 24;
+const MAX_POLLEN_LEVEL = 4;
+
+// History shared by every pollen card on the page. Requests made within a
+// short window are batched into a single history/history_during_period call,
+// so nested and lazily created cards share it too. Requests made while a call
+// is in flight go into the next call. Later state changes are appended to the
+// cached series.
+class PollenHistoryCache {
+  constructor() {
+    this._entries = new Map();
+    this._pending = new Set();
+    this._listeners = new Set();
+    this._flushTimer = null;
+    this._inFlight = false;
+    this._hass = null;
+  }
+
+  subscribe(listener) {
+    this._listeners.add(listener);
+    return () => this._listeners.delete(listener);
+  }
+
+  get(entityId) {
+    return this._entries.get(entityId);
+  }
+
+  request(hass, entityIds) {
+    this._hass = hass;
+    const now = Date.now();
+
+    entityIds.forEach(entityId => {
+      const entry = this._entries.get(entityId);
+      if (!entry || (entry.failedAt && now - entry.failedAt > SPARKLINE_RETRY_MS)) {
+        this._entries.set(entityId, {
+          points: [],
+          version: 0,
+          loading: true,
+          lastState: hass.states[entityId]
+        });
+        this._pending.add(entityId);
+      }
+    });
+
+    this._scheduleFlush();
+  }
+
+  _scheduleFlush() {
+    if (this._pending.size === 0 || this._flushTimer !== null || this._inFlight) return;
+    this._flushTimer = setTimeout(() => {
+      this._flushTimer = null;
+      this._flush();
+    }, SPARKLINE_BATCH_MS);
+  }
+
+  update(hass, entityIds) {
+    let changed = false;
+    const cutoff = Date.now() / 1000 - SPARKLINE_HOURS * 3600;
+
+    entityIds.forEach(entityId => {
+      const entry = this._entries.get(entityId);
+      const stateObj = hass.states[entityId];
+      if (!entry || !stateObj || entry.lastState === stateObj) return;
+
+      entry.lastState = stateObj;
+      const value = Number(stateObj.state);
+      if (Number.isNaN(value)) return;
+
+      const last = entry.points[entry.points.length - 1];
+      if (last && last[1] === value) return;
+
+      entry.points.push([Date.parse(stateObj.last_updated) / 1000, value]);
+      while (entry.points.length > 1 && entry.points[1][0] < cutoff) {
+        entry.points.shift();
+      }
+      entry.version += 1;
+      changed = true;
+    });
+
+    if (changed) this._notify();
+  }
+
+  async _flush() {
+    const entityIds = [...this._pending];
+    this._pending.clear();
+    if (entityIds.length === 0 || !this._hass) return;
+
+    this._inFlight = true;
+    try {
+      await this._load(entityIds);
+    } finally {
+      this._inFlight = false;
+      this._scheduleFlush();
+    }
+  }
+
+  async _load(entityIds) {
+    const start = new Date(Date.now() - SPARKLINE_HOURS * 3600 * 1000);
+    let history;
+    try {
+      history = await this._hass.callWS({
+        type: 'history/history_during_period',
+        start_time: start.toISOString(),
+        entity_ids: entityIds,
+        minimal_response: true,
+        no_attributes: true,
+        significant_changes_only: false
+      });
+    } catch (err) {
+      console.warn('pollen-card: failed to load history', err);
+      entityIds.forEach(entityId => {
+        const entry = this._entries.get(entityId);
+        if (entry) entry.failedAt = Date.now();
+      });
+      return;
+    }
+
+    entityIds.forEach(entityId => {
+      const entry = this._entries.get(entityId);
+      if (!entry) return;
+
+      const points = [];
+      (history[entityId] || []).forEach(item => {
+        const value = Number(item.s);
+        if (!Number.isNaN(value)) points.push([item.lu, value]);
+      });
+
+      // Keep changes that arrived while the request was in flight
+      const lastTime = points.length > 0 ? points[points.length - 1][0] : 0;
+      entry.points = points.concat(entry.points.filter(point => point[0] > lastTime));
+      entry.loading = false;
+      entry.failedAt = null;
+      entry.version += 1;
+    });
+
+    this._notify();
+  }
+
+  _notify() {
+    this._listeners.forEach(listener => listener());
+  }
+}
+
+const pollenHistory = new PollenHistoryCache();
+
 class PollenCard extends HTMLElement {
   constructor() {
     super();
     this.attachShadow({ mode: 'open' });
     this._config = {};
     this._hass = {};
+    this._renderedStates = [];
+    this._canvases = new Map();
+    this._drawScheduled = false;
+    this._unsubscribe = null;
   }
 
   static get properties() {
@@ -23,25 +176,53 @@ class PollenCard extends HTMLElement {
       show_forecast: config.show_forecast !== false,
       show_levels: config.show_levels !== false,
       show_thresholds: config.show_thresholds !== false,
+      show_sparklines: config.show_sparklines !== false,
       entities: config.entities || [],
       region: config.region || '',
       ...config
     };
     
+    this._renderedStates = [];
     this.render();
   }
 
   set hass(hass) {
     this._hass = hass;
-    this.render();
+
+    // Only rebuild the card when one of the displayed entities changed
+    const states = this.getDisplayedStates();
+    if (states.length !== this._renderedStates.length ||
+        states.some((state, index) => state !== this._renderedStates[index])) {
+      this._renderedStates = states;
+      this.render();
+    }
+
+    if (this._config.show_sparklines) {
+      const entityIds = this.getPollenSensors().map(sensor => sensor.entity_id);
+      pollenHistory.request(hass, entityIds);
+      pollenHistory.update(hass, entityIds);
+    }
   }
 
   get hass() {
     return this._hass;
   }
 
+  connectedCallback() {
+    if (!this._unsubscribe) {
+      this._unsubscribe = pollenHistory.subscribe(() => this.scheduleDraw());
+    }
+  }
+
+  disconnectedCallback() {
+    if (this._unsubscribe) {
+      this._unsubscribe();
+      this._unsubscribe = null;
+    }
+  }
+
   render() {
-    if (!this._hass || !this._config) return;
+    if (!this._hass || !this._hass.states || !this._config) return;
 
     const pollenSensors = this.getPollenSensors();
     const forecastSensor = this.getForecastSensor();
@@ -164,6 +345,18 @@ class PollenCard extends HTMLElement {
         .icon {
           margin-right: 8px;
         }
+        
+        .sparkline {
+          margin-top: 6px;
+          width: ${SPARKLINE_WIDTH}px;
+          height: ${SPARKLINE_HEIGHT}px;
+        }
+        
+        .sparkline canvas {
+          display: block;
+          width: ${SPARKLINE_WIDTH}px;
+          height: ${SPARKLINE_HEIGHT}px;
+        }
       </style>
       
       <div class="card">
@@ -191,7 +384,7 @@ class PollenCard extends HTMLElement {
               <ha-icon icon="mdi:weather-partly-cloudy" class="icon"></ha-icon>
               Forecast
             </h3>
-            <div class="forecast-text">${forecastSensor.state}</div>
+            <div class="forecast-text">${forecastSensor.attributes.forecast || forecastSensor.state}</div>
           </div>
         ` : ''}
         
@@ -202,6 +395,8 @@ class PollenCard extends HTMLElement {
         ` : ''}
       </div>
     `;
+
+    this.attachSparklines();
   }
 
   renderPollenItem(sensor) {
@@ -222,6 +417,9 @@ class PollenCard extends HTMLElement {
           ${this._config.show_thresholds ? `
             <div class="pollen-details">Range: ${levelThreshold} grains/m³</div>
           ` : ''}
+          ${this._config.show_sparklines ? `
+            <div class="sparkline" data-entity="${sensor.entity_id}"></div>
+          ` : ''}
         </div>
         <div class="pollen-level">
           <div class="level-indicator" style="background-color: ${color};">
@@ -233,6 +431,93 @@ class PollenCard extends HTMLElement {
     `;
   }
 
+  attachSparklines() {
+    if (!this._config.show_sparklines) return;
+
+    // Reuse canvases across renders so unchanged sparklines keep their pixels
+    const placeholders = this.shadowRoot.querySelectorAll('.sparkline');
+    const displayed = new Set();
+    placeholders.forEach(placeholder => {
+      const entityId = placeholder.dataset.entity;
+      let canvas = this._canvases.get(entityId);
+      if (!canvas) {
+        canvas = document.createElement('canvas');
+        this._canvases.set(entityId, canvas);
+      }
+      placeholder.appendChild(canvas);
+      displayed.add(entityId);
+    });
+
+    this._canvases.forEach((canvas, entityId) => {
+      if (!displayed.has(entityId)) this._canvases.delete(entityId);
+    });
+
+    this.scheduleDraw();
+  }
+
+  scheduleDraw() {
+    if (this._drawScheduled) return;
+    this._drawScheduled = true;
+    requestAnimationFrame(() => {
+      this._drawScheduled = false;
+      this.drawSparklines();
+    });
+  }
+
+  drawSparklines() {
+    this._canvases.forEach((canvas, entityId) => {
+      const entry = pollenHistory.get(entityId);
+      const stateObj = this._hass.states[entityId];
+      if (!entry || entry.points.length === 0 || !stateObj) return;
+
+      const color = stateObj.attributes.color || '#cccccc';
+      const ratio = window.devicePixelRatio || 1;
+      if (canvas._version === entry.version && canvas._color === color &&
+          canvas._ratio === ratio) {
+        return;
+      }
+      canvas._version = entry.version;
+      canvas._color = color;
+      canvas._ratio = ratio;
+
+      canvas.width = SPARKLINE_WIDTH * ratio;
+      canvas.height = SPARKLINE_HEIGHT * ratio;
+      const ctx = canvas.getContext('2d');
+      ctx.scale(ratio, ratio);
+      ctx.clearRect(0, 0, SPARKLINE_WIDTH, SPARKLINE_HEIGHT);
+
+      // Levels are steps, so draw the series as a step line up to now
+      const end = Date.now() / 1000;
+      const start = end - SPARKLINE_HOURS * 3600;
+      const x = time => (Math.max(time, start) - start) / (end - start) * SPARKLINE_WIDTH;
+      const y = value => SPARKLINE_HEIGHT - 1 -
+        Math.min(value, MAX_POLLEN_LEVEL) / MAX_POLLEN_LEVEL * (SPARKLINE_HEIGHT - 2);
+
+      ctx.beginPath();
+      entry.points.forEach(([time, value], index) => {
+        if (index === 0) {
+          ctx.moveTo(x(time), y(value));
+        } else {
+          ctx.lineTo(x(time), y(entry.points[index - 1][1]));
+          ctx.lineTo(x(time), y(value));
+        }
+      });
+      ctx.lineTo(SPARKLINE_WIDTH, y(entry.points[entry.points.length - 1][1]));
+      ctx.strokeStyle = color;
+      ctx.lineWidth = 1.5;
+      ctx.stroke();
+    });
+  }
+
+  getDisplayedStates() {
+    if (!this._hass || !this._hass.states) return [];
+
+    const states = this.getPollenSensors();
+    const forecastSensor = this.getForecastSensor();
+    if (forecastSensor) states.push(forecastSensor);
+    return states;
+  }
+
   getPollenSensors() {
     const sensors = [];
     